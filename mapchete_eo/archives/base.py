@@ -2,7 +2,6 @@ from abc import ABC
 import logging
 from typing import Any, Callable, Dict, Generator, List, Optional, Union
 
-from mapchete.io.vector import IndexedFeatures
 from mapchete.types import Bounds
 from pystac import Item
 from shapely.errors import GEOSException
@@ -24,7 +23,7 @@ class Archive(ABC):
     area: BaseGeometry
     catalog: CatalogSearcher
     search_kwargs: Dict[str, Any]
-    _items: Optional[IndexedFeatures] = None
+    _items: Optional[List[Item]] = None
     item_modifier_funcs: Optional[List[Callable[[Item], Item]]] = None
 
     def __init__(
@@ -59,7 +58,12 @@ class Archive(ABC):
         return item
 
     def items(self) -> Generator[Item, None, None]:
-        for item in self.catalog.search(
-            time=self.time, area=self.area, search_kwargs=self.search_kwargs
-        ):
-            yield self.apply_item_modifier_funcs(item)
+        # only search catalog once, items are iterated multiple times by InputData
+        if self._items is None:
+            self._items = [
+                self.apply_item_modifier_funcs(item)
+                for item in self.catalog.search(
+                    time=self.time, area=self.area, search_kwargs=self.search_kwargs
+                )
+            ]
+        yield from self._items
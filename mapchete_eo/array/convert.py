@@ -115,27 +115,23 @@ def to_dataset(
         slices_attrs = (
             [None for _ in range(slices)] if slices_attrs is None else slices_attrs
         )
-        coords = {slice_axis_name: slice_names}
+        # fill the whole array at once and pass on each slice as (dims, data, attrs)
+        # tuple, which avoids creating and aligning one xr.DataArray per slice
+        dims = [band_axis_name, x_axis_name, y_axis_name]
         return xr.Dataset(
             data_vars={
-                # every slice gets its own xarray Dataset
-                slice_name: to_dataarray(
+                slice_name: (
+                    dims,
                     slice_array,
-                    nodataval=nodataval,
-                    band_names=band_names,
-                    name=slice_name,
-                    attrs=slice_attrs,
-                    band_axis_name=band_axis_name,
-                    x_axis_name=x_axis_name,
-                    y_axis_name=y_axis_name,
+                    dict(slice_attrs or dict(), _FillValue=nodataval),
                 )
                 for slice_name, slice_attrs, slice_array in zip(
                     slice_names,
                     slices_attrs,
-                    masked_arr,
+                    masked_arr.filled(nodataval),
                 )
             },
-            coords=coords,
+            coords={slice_axis_name: slice_names, band_axis_name: band_names},
             attrs=dict(attrs, _FillValue=nodataval),
         ).transpose(slice_axis_name, band_axis_name, x_axis_name, y_axis_name)
 
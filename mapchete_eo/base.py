@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from functools import cached_property
-from typing import Any, Callable, List, Optional, Type, Union
+from typing import Any, Callable, List, Optional, Tuple, Type, Union
 
 import croniter
 import numpy.ma as ma
@@ -377,6 +378,8 @@ class InputData(base.InputData):
     time: Union[TimeRange, List[TimeRange]]
     area: BaseGeometry
     _products: Optional[IndexedFeatures] = None
+    _tile_products_cache: OrderedDict[Tuple[float, ...], List[EOProductProtocol]]
+    tile_products_cache_size: int = 4096
 
     def __init__(
         self,
@@ -391,6 +394,7 @@ class InputData(base.InputData):
         self.readonly = readonly
         self.input_key = input_key
         self.standalone = standalone
+        self._tile_products_cache = OrderedDict()
 
         self.params = self.driver_config_model(**input_params["abstract"])
         # we have to make sure, the cache path is absolute
@@ -510,13 +514,7 @@ class InputData(base.InputData):
         Return InputTile object.
         """
         try:
-            tile_products = self.products.filter(
-                reproject_geometry(
-                    tile.bbox,
-                    src_crs=tile.crs,
-                    dst_crs=mapchete_eo_settings.default_catalog_crs,
-                ).bounds
-            )
+            tile_products = self._tile_products(tile)
         except PreprocessingNotFinished:  # pragma: no cover
             tile_products = None
         return self.input_tile_cls(
@@ -529,6 +527,26 @@ class InputData(base.InputData):
             area=self.area.intersection(tile.bbox),
         )
 
+    def _tile_products(self, tile: BufferedTile) -> List[EOProductProtocol]:
+        """Return products intersecting with tile, cached per tile bounds."""
+        key = tuple(tile.bounds)
+        try:
+            # mark as most recently used
+            self._tile_products_cache.move_to_end(key)
+        except KeyError:
+            self._tile_products_cache[key] = self.products.filter(
+                reproject_geometry(
+                    tile.bbox,
+                    src_crs=tile.crs,
+                    dst_crs=mapchete_eo_settings.default_catalog_crs,
+                ).bounds
+            )
+            # drop least recently used entries
+            while len(self._tile_products_cache) > self.tile_products_cache_size:
+                self._tile_products_cache.popitem(last=False)
+        return self._tile_products_cache[key]
+
     def cleanup(self):
+        self._tile_products_cache.clear()
         for product in self.products:
             product.clear_cached_data()
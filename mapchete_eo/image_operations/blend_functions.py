@@ -22,9 +22,25 @@ OR OTHER DEALINGS IN THE SOFTWARE.
 
 """
 
+from functools import wraps
+from typing import Callable
+
 import numpy as np
 
 
+def _skip_transparent_layer(func: Callable) -> Callable:
+    """Return image unchanged if layer is fully transparent."""
+
+    @wraps(func)
+    def _func(fg: np.ndarray, bg: np.ndarray, opacity: float):
+        # with an alpha ratio of 0 the blended colors do not contribute to the output
+        if opacity == 0:
+            return np.nan_to_num(fg.astype(np.result_type(fg, bg)), copy=False)
+        return func(fg, bg, opacity)
+
+    return _func
+
+
 def _compose_alpha(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Calculate alpha composition ratio between two images."""
 
@@ -36,6 +52,19 @@ def _compose_alpha(fg: np.ndarray, bg: np.ndarray, opacity: float):
     return ratio
 
 
+def _apply_ratio(
+    comp: np.ndarray, fg: np.ndarray, ratio: np.ndarray, clip: bool = False
+) -> np.ndarray:
+    """Mix blended colors with layer colors by alpha ratio and add layer alpha."""
+    # broadcast ratio over the color channels instead of repeating it into a new array
+    ratio_rs = ratio[:, :, np.newaxis]
+    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
+    if clip:
+        np.clip(img_out, 0.0, 1.0, out=img_out)
+    # add alpha channel and replace nans
+    return np.nan_to_num(np.dstack((img_out, fg[:, :, 3])), copy=False)
+
+
 def normal(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply "normal" blending mode of a layer on an image.
 
@@ -78,6 +107,7 @@ def normal(fg: np.ndarray, bg: np.ndarray, opacity: float):
     return img_out
 
 
+@_skip_transparent_layer
 def soft_light(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply soft light blending mode of a layer on an image.
 
@@ -104,23 +134,16 @@ def soft_light(fg: np.ndarray, bg: np.ndarray, opacity: float):
     #   multiply = fg[:, :, :3]*bg[:, :, :3]
     #   screen = 1.0 - (1.0-fg[:, :, :3])*(1.0-bg[:, :, :3])
     #   comp = (1.0 - fg[:, :, :3]) * multiply + fg[:, :, :3] * screen
-    #   ratio_rs = np.reshape(np.repeat(ratio,3),comp.shape)
-    #   img_out = comp*ratio_rs + fg[:, :, :3] * (1.0-ratio_rs)
+    #   img_out = comp*ratio + fg[:, :, :3] * (1.0-ratio)
 
     comp = (1.0 - fg[:, :, :3]) * fg[:, :, :3] * bg[:, :, :3] + fg[:, :, :3] * (
         1.0 - (1.0 - fg[:, :, :3]) * (1.0 - bg[:, :, :3])
     )
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def lighten_only(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply lighten only blending mode of a layer on an image.
 
@@ -145,16 +168,10 @@ def lighten_only(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = np.maximum(fg[:, :, :3], bg[:, :, :3])
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def screen(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply screen blending mode of a layer on an image.
 
@@ -179,16 +196,10 @@ def screen(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = 1.0 - (1.0 - fg[:, :, :3]) * (1.0 - bg[:, :, :3])
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def dodge(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply dodge blending mode of a layer on an image.
 
@@ -213,16 +224,10 @@ def dodge(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = np.minimum(fg[:, :, :3] / (1.0 - bg[:, :, :3]), 1.0)
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def addition(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply addition blending mode of a layer on an image.
 
@@ -247,16 +252,10 @@ def addition(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = fg[:, :, :3] + bg[:, :, :3]
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = np.clip(comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs), 0.0, 1.0)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio, clip=True)
 
 
+@_skip_transparent_layer
 def darken_only(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply darken only blending mode of a layer on an image.
 
@@ -281,16 +280,10 @@ def darken_only(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = np.minimum(fg[:, :, :3], bg[:, :, :3])
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def multiply(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply multiply blending mode of a layer on an image.
 
@@ -315,16 +308,10 @@ def multiply(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = np.clip(bg[:, :, :3] * fg[:, :, :3], 0.0, 1.0)
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def hard_light(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply hard light blending mode of a layer on an image.
 
@@ -354,16 +341,10 @@ def hard_light(fg: np.ndarray, bg: np.ndarray, opacity: float):
         fg[:, :, :3] * (bg[:, :, :3] * 2.0), 1.0
     )
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def difference(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply difference blending mode of a layer on an image.
 
@@ -389,16 +370,10 @@ def difference(fg: np.ndarray, bg: np.ndarray, opacity: float):
     comp = fg[:, :, :3] - bg[:, :, :3]
     comp[comp < 0.0] *= -1.0
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def subtract(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply subtract blending mode of a layer on an image.
 
@@ -423,16 +398,10 @@ def subtract(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = fg[:, :, :3] - bg[:, :, :3]
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = np.clip(comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs), 0.0, 1.0)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio, clip=True)
 
 
+@_skip_transparent_layer
 def grain_extract(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply grain extract blending mode of a layer on an image.
 
@@ -456,16 +425,10 @@ def grain_extract(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = np.clip(fg[:, :, :3] - bg[:, :, :3] + 0.5, 0.0, 1.0)
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def grain_merge(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply grain merge blending mode of a layer on an image.
 
@@ -489,16 +452,10 @@ def grain_merge(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     comp = np.clip(fg[:, :, :3] + bg[:, :, :3] - 0.5, 0.0, 1.0)
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def divide(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply divide blending mode of a layer on an image.
 
@@ -526,16 +483,10 @@ def divide(fg: np.ndarray, bg: np.ndarray, opacity: float):
         1.0,
     )
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
 
 
+@_skip_transparent_layer
 def overlay(fg: np.ndarray, bg: np.ndarray, opacity: float):
     """Apply overlay blending mode of a layer on an image.
 
@@ -563,17 +514,11 @@ def overlay(fg: np.ndarray, bg: np.ndarray, opacity: float):
 
     ratio = _compose_alpha(fg, bg, opacity)
 
-    comp = np.less(fg[:, :, :3], 0.5) * (
-        2 * fg[:, :, :3] * bg[:, :, :3]
-    ) + np.greater_equal(fg[:, :, :3], 0.5) * (
-        1 - (2 * (1 - fg[:, :, :3]) * (1 - bg[:, :, :3]))
+    # select between both branches instead of masking and summing them
+    comp = np.where(
+        fg[:, :, :3] < 0.5,
+        2 * fg[:, :, :3] * bg[:, :, :3],
+        1 - (2 * (1 - fg[:, :, :3]) * (1 - bg[:, :, :3])),
     )
 
-    ratio_rs = np.reshape(
-        np.repeat(ratio, 3), [comp.shape[0], comp.shape[1], comp.shape[2]]
-    )
-    img_out = comp * ratio_rs + fg[:, :, :3] * (1.0 - ratio_rs)
-    img_out = np.nan_to_num(
-        np.dstack((img_out, fg[:, :, 3]))
-    )  # add alpha channel and replace nans
-    return img_out
+    return _apply_ratio(comp, fg, ratio)
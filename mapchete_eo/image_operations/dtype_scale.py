@@ -28,16 +28,17 @@ def dtype_scale(
     if nodata is None:
         nodata = 0
 
-    return ma.masked_where(
-        bands == nodata,
-        np.where(
-            bands.mask,
-            nodata,
-            np.clip(
-                (bands.astype("float16", copy=False) / max_source_value)
-                * max_output_value,
-                1,
-                max_output_value,
-            ),
-        ),
-    ).astype(out_dtype, copy=False)
+    # run arithmetics on the plain arrays to avoid the masked array overhead; scale
+    # values are passed on as arrays to keep the same type promotion as numpy.ma
+    data = ma.getdata(bands)
+    mask = ma.getmaskarray(bands)
+    scaled = np.clip(
+        (data.astype("float16", copy=False) / np.asarray(max_source_value))
+        * np.asarray(max_output_value),
+        1,
+        max_output_value,
+    )
+    return ma.masked_array(
+        data=np.where(mask, nodata, scaled).astype(out_dtype, copy=False),
+        mask=mask | (data == nodata),
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, List, Optional, Union
 
 import fsspec
@@ -23,10 +24,12 @@ from rasterio.enums import Resampling
 from rasterio.features import rasterize
 from rasterio.profiles import Profile
 from rasterio.vrt import WarpedVRT
+from rasterio.windows import Window
 from retry import retry
 
 from mapchete_eo.io.path import COMMON_RASTER_EXTENSIONS, asset_mpath, cached_path
 from mapchete_eo.io.profiles import COGDeflateProfile
+from mapchete_eo.settings import mapchete_eo_settings
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +96,7 @@ def asset_to_np_array(
         grid=grid,
         resampling=resampling.name,
         dst_nodata=stac_raster_bands.nodata,
+        gdal_opts=dict(GDAL_NUM_THREADS=str(mapchete_eo_settings.gdal_num_threads)),
     ).data
 
     if apply_offset and stac_raster_bands.offset:
@@ -105,16 +109,17 @@ def asset_to_np_array(
         if clip_min == stac_raster_bands.nodata:
             clip_min += 1
 
-        data[:] = (
-            (
-                ((data * stac_raster_bands.scale) + stac_raster_bands.offset)
-                / stac_raster_bands.scale
-            )
-            .round()
-            .clip(clip_min, clip_max)
-            .astype(data_type, copy=False)
-            .data
-        )
+        # calculate in place on one float array instead of creating a new masked array
+        # for every single operation
+        values = data.data * stac_raster_bands.scale
+        values += stac_raster_bands.offset
+        values /= stac_raster_bands.scale
+        # masked pixels keep their original values
+        if data.mask.any():
+            np.copyto(values, data.data, where=data.mask)
+        np.round(values, out=values)
+        np.clip(values, clip_min, clip_max, out=values)
+        data[:] = values.astype(data_type, copy=False)
 
     return data
 
@@ -129,17 +134,22 @@ def get_assets(
     convert_profile: Optional[Profile] = None,
     item_href_in_dst_dir: bool = True,
     ignore_if_exists: bool = False,
+    max_workers: int = 8,
+    num_threads: Union[None, int, str] = None,
 ) -> pystac.Item:
     """
     Copy or convert assets depending on settings.
 
     Conversion is triggered if either resolution or convert_profile is provided.
+    Assets are processed concurrently using up to max_workers threads, each conversion
+    uses num_threads GDAL warp threads.
     """
-    for asset in assets:
+
+    def _get_asset(asset: str) -> pystac.Item:
         path = asset_mpath(item, asset, fs=src_fs)
         # convert if possible
         if should_be_converted(path, resolution=resolution, profile=convert_profile):
-            item = convert_asset(
+            return convert_asset(
                 item,
                 asset,
                 dst_dir,
@@ -149,11 +159,11 @@ def get_assets(
                 ignore_if_exists=ignore_if_exists,
                 profile=convert_profile or COGDeflateProfile(),
                 item_href_in_dst_dir=item_href_in_dst_dir,
+                num_threads=num_threads,
             )
-            continue
 
         # copy
-        item = copy_asset(
+        return copy_asset(
             item,
             asset,
             dst_dir,
@@ -162,6 +172,13 @@ def get_assets(
             item_href_in_dst_dir=item_href_in_dst_dir,
         )
 
+    if not assets:
+        return item
+
+    # every call only updates the href of its own asset on the very same item
+    with ThreadPoolExecutor(max_workers=min(len(assets), max_workers)) as executor:
+        list(executor.map(_get_asset, assets))
+
     return item
 
 
@@ -173,8 +190,16 @@ def copy_asset(
     overwrite: bool = False,
     item_href_in_dst_dir: bool = True,
     ignore_if_exists: bool = False,
+    read_blocksize: int = 64 * 1024 * 1024,
+    read_chunksize: int = 8 * 1024 * 1024,
 ) -> pystac.Item:
-    """Copy asset from one place to another."""
+    """
+    Copy asset from one place to another.
+
+    Copies within the same filesystem (e.g. between S3 buckets) are done remotely,
+    otherwise the asset is streamed using large read blocks and chunks to keep the
+    number of requests low.
+    """
     src_path = asset_mpath(item, asset, fs=src_fs)
     output_path = dst_dir / src_path.name
 
@@ -202,6 +227,8 @@ def copy_asset(
             src_path,
             output_path,
             overwrite=overwrite,
+            read_blocksize=read_blocksize,
+            read_chunksize=read_chunksize,
         )
     logger.debug("copied asset '%s' in %s", asset, t)
 
@@ -218,6 +245,7 @@ def convert_asset(
     profile: Optional[Profile] = None,
     item_href_in_dst_dir: bool = True,
     ignore_if_exists: bool = False,
+    num_threads: Union[None, int, str] = None,
 ) -> pystac.Item:
     """
     Convert asset to a different format.
@@ -245,7 +273,9 @@ def convert_asset(
         dst_dir.makedirs()
 
     with Timer() as t:
-        convert_raster(src_path, output_path, resolution, profile)
+        convert_raster(
+            src_path, output_path, resolution, profile, num_threads=num_threads
+        )
     logger.debug("converted asset '%s' in %s", asset, t)
 
     return item
@@ -257,7 +287,15 @@ def convert_raster(
     dst_path: MPath,
     resolution: Union[None, float, int] = None,
     profile: Optional[Profile] = None,
+    num_threads: Union[None, int, str] = None,
 ) -> None:
+    """
+    Convert raster to a different resolution and/or profile.
+
+    num_threads GDAL warp threads are used, by default the gdal_num_threads setting. This
+    is kept low as multiple assets are usually converted concurrently.
+    """
+    num_threads = num_threads or mapchete_eo_settings.gdal_num_threads
     with rasterio_open(src_path, "r") as src:
         meta = src.meta.copy()
         if profile:
@@ -296,8 +334,20 @@ def convert_raster(
                 width=meta["width"],
                 height=meta["height"],
                 transform=meta["transform"],
+                # let GDAL distribute warping across multiple threads
+                NUM_THREADS=num_threads,
             ) as warped:
-                dst.write(warped.read())
+                # read and write in strips instead of the whole raster at once to
+                # keep the memory footprint low
+                strip_height = meta.get("blockysize", 512)
+                for row_off in range(0, meta["height"], strip_height):
+                    window = Window(
+                        col_off=0,
+                        row_off=row_off,
+                        width=meta["width"],
+                        height=min(strip_height, meta["height"] - row_off),
+                    )
+                    dst.write(warped.read(window=window), window=window)
 
 
 def get_metadata_assets(
@@ -308,8 +358,14 @@ def get_metadata_assets(
     resolution: Union[None, float, int] = None,
     convert_profile: Optional[Profile] = None,
     metadata_asset_names: List[str] = ["metadata", "granule_metadata"],
+    max_workers: int = 8,
+    num_threads: Union[None, int, str] = None,
 ):
-    """Copy STAC item metadata and its metadata assets."""
+    """
+    Copy STAC item metadata and its metadata assets.
+
+    Metadata assets are processed concurrently using up to max_workers threads.
+    """
     for metadata_asset in metadata_asset_names:
         try:
             src_metadata_xml = MPath(item.assets[metadata_asset].href)
@@ -339,19 +395,32 @@ def get_metadata_assets(
 
     # copy assets
     original_asset_paths = src_metadata.assets
-    for asset, dst_path in dst_metadata.assets.items():
+
+    def _get_metadata_asset(asset: str) -> None:
         src_path = original_asset_paths[asset]
+        dst_path = dst_metadata.assets[asset]
 
         if overwrite or not dst_path.exists():
             # convert if possible
             if should_be_converted(
                 src_path, resolution=resolution, profile=convert_profile
             ):  # pragma: no cover
-                convert_raster(src_path, dst_path, resolution, convert_profile)
+                convert_raster(
+                    src_path,
+                    dst_path,
+                    resolution,
+                    convert_profile,
+                    num_threads=num_threads,
+                )
             else:
                 logger.debug("copy %s ...", asset)
                 copy(src_path, dst_path, overwrite=overwrite)
 
+    assets = list(dst_metadata.assets)
+    if assets:
+        with ThreadPoolExecutor(max_workers=min(len(assets), max_workers)) as executor:
+            list(executor.map(_get_metadata_asset, assets))
+
     return item
 
 
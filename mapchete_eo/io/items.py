@@ -1,16 +1,19 @@
 import logging
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
+from typing import Any, Iterable, List, Optional, Tuple
 
 import numpy.ma as ma
 import pystac
 from mapchete.protocols import GridProtocol
-from mapchete.types import Bounds, NodataVals
+from mapchete.types import Bounds, NodataVal, NodataVals
 from rasterio.enums import Resampling
 from shapely.geometry import mapping, shape
 
 from mapchete_eo.exceptions import EmptyProductException
 from mapchete_eo.geometry import repair_antimeridian_geometry
 from mapchete_eo.io.assets import asset_to_np_array
+from mapchete_eo.settings import mapchete_eo_settings
 from mapchete_eo.types import BandLocation
 
 logger = logging.getLogger(__name__)
@@ -29,24 +32,33 @@ def item_to_np_array(
     Read window of STAC Item and merge into a 3D ma.MaskedArray.
     """
     logger.debug("reading %s assets from item %s...", len(band_locations), item.id)
-    out = ma.stack(
-        [
-            asset_to_np_array(
-                item,
-                band_location.asset_name,
-                indexes=band_location.band_index,
-                grid=grid,
-                resampling=expanded_resampling,
-                nodataval=nodataval,
-                apply_offset=apply_offset,
-            )
-            for band_location, expanded_resampling, nodataval in zip(
-                band_locations,
-                expand_params(resampling, len(band_locations)),
-                expand_params(nodatavals, len(band_locations)),
-            )
-        ]
+
+    def _read_asset(read_args: Tuple[BandLocation, Resampling, NodataVal]):
+        band_location, expanded_resampling, nodataval = read_args
+        return asset_to_np_array(
+            item,
+            band_location.asset_name,
+            indexes=band_location.band_index,
+            grid=grid,
+            resampling=expanded_resampling,
+            nodataval=nodataval,
+            apply_offset=apply_offset,
+        )
+
+    assets_read_args = list(
+        zip(
+            band_locations,
+            expand_params(resampling, len(band_locations)),
+            expand_params(nodatavals, len(band_locations)),
+        )
     )
+    max_workers = min(len(assets_read_args), mapchete_eo_settings.io_threads)
+    if max_workers > 1:
+        # reading assets is I/O bound and GDAL releases the GIL
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            out = ma.stack(list(executor.map(_read_asset, assets_read_args)))
+    else:
+        out = ma.stack([_read_asset(read_args) for read_args in assets_read_args])
 
     if raise_empty and out.mask.all():
         raise EmptyProductException(
@@ -56,7 +68,7 @@ def item_to_np_array(
     return out
 
 
-def expand_params(param, length):
+def expand_params(param, length) -> Iterable:
     """
     Expand parameters if they are not a list.
     """
@@ -64,7 +76,7 @@ def expand_params(param, length):
         if len(param) != length:
             raise ValueError(f"length of {param} must be {length} but is {len(param)}")
         return param
-    return [param for _ in range(length)]
+    return repeat(param, length)
 
 
 def get_item_property(
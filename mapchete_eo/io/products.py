@@ -5,6 +5,7 @@ import logging
 from collections import defaultdict
 from datetime import datetime
 import gc
+from itertools import chain
 from typing import Any, Dict, Generator, Iterator, List, Optional, Sequence
 
 from mapchete import Timer
@@ -299,31 +300,28 @@ def merge_products(
 
     # read all and average
     elif merge_method == MergeMethod.average:
-
-        def _generate_arrays(
-            first_product_array: ma.MaskedArray,
-            remaining_product_arrays: Generator[ma.MaskedArray, None, None],
-        ) -> Generator[ma.MaskedArray, None, None]:
-            """Yield all available product arrays."""
-            yield first_product_array
-            yield from remaining_product_arrays
-
-        # explicitly specify dtype to avoid casting of integer arrays to floats
-        # during mean conversion:
-        # https://numpy.org/doc/stable/reference/generated/numpy.mean.html#numpy.mean
-        arrays = list(
-            _generate_arrays(
-                out,
-                read_remaining_valid_products(products_iter, product_read_kwargs),
-            )
-        )
-
-        # Filter out arrays that are entirely masked
-        valid_arrays = [a for a in arrays if not ma.getmaskarray(a).all()]
-
-        if valid_arrays:
-            stacked = ma.stack(valid_arrays, dtype=out.dtype)
-            out = stacked.mean(axis=0, dtype=out.dtype)
+        # instead of stacking all product arrays, accumulate sums and valid pixel
+        # counts product by product, so only one product array has to be kept in
+        # memory at a time
+        # sums are calculated using the original dtype in order to produce the same
+        # values as MaskedArray.mean(axis=0, dtype=out.dtype) would
+        sums: Optional[np.ndarray] = None
+        counts: Optional[np.ndarray] = None
+        for arr in chain(
+            [out], read_remaining_valid_products(products_iter, product_read_kwargs)
+        ):
+            mask = ma.getmaskarray(arr)
+            # skip arrays that are entirely masked
+            if mask.all():
+                continue
+            if sums is None or counts is None:
+                sums = np.zeros(out.shape, dtype=out.dtype)
+                counts = np.zeros(out.shape, dtype=np.intp)
+            sums += arr.filled(0).astype(out.dtype, copy=False)
+            counts += ~mask
+
+        if sums is not None and counts is not None:
+            out = ma.masked_array(sums, mask=counts == 0) * 1.0 / counts
         else:
             # All arrays were fully masked — return fully masked output
             out = ma.masked_all(out.shape, dtype=out.dtype)
@@ -186,9 +186,7 @@ class S2Product(EOProduct, EOProductProtocol):
     @property
     def metadata(self) -> S2Metadata:
         if not self._metadata:
-            self._metadata = S2Metadata.from_stac_item(
-                pystac.Item.from_dict(self.item_dict)
-            )
+            self._metadata = S2Metadata.from_stac_item(self.item)
         return self._metadata
 
     def __repr__(self):
@@ -200,6 +198,7 @@ class S2Product(EOProduct, EOProductProtocol):
             self._metadata.clear_cached_data()
             self._metadata = None
         self._scl_cache = dict()
+        self._item = None
 
     def read_np_array(
         self,
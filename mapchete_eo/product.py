@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, List, Literal, Optional, Set
+from collections import defaultdict
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
 
 import numpy as np
 import numpy.ma as ma
@@ -29,6 +30,7 @@ class EOProduct(EOProductProtocol):
     """Wrapper class around a pystac.Item which provides read functions."""
 
     default_dtype: DTypeLike = np.uint16
+    _item: Optional[pystac.Item] = None
 
     def __init__(self, item: pystac.Item):
         self.item_dict = item.to_dict()
@@ -40,11 +42,14 @@ class EOProduct(EOProductProtocol):
         return f"<EOProduct product_id={self.item.id}>"
 
     def clear_cached_data(self):
-        pass
+        self._item = None
 
     @property
     def item(self) -> pystac.Item:
-        return pystac.Item.from_dict(self.item_dict)
+        # pystac.Item.from_dict() deepcopies the whole dictionary, so only do it once
+        if self._item is None:
+            self._item = pystac.Item.from_dict(self.item_dict)
+        return self._item
 
     @classmethod
     def from_stac_item(self, item: pystac.Item, **kwargs) -> EOProduct:
@@ -179,7 +184,12 @@ def eo_bands_to_band_locations(
     """
     Find out location (asset and band index) of EO band.
     """
-    return [find_eo_band(item, eo_band, role=role) for eo_band in eo_bands]
+    # index item assets only once instead of looking through them for every band
+    eo_bands_index = _eo_bands_index(item, role=role)
+    return [
+        _select_band_location(eo_band, eo_bands_index.get(eo_band, []))
+        for eo_band in eo_bands
+    ]
 
 
 def find_eo_band(
@@ -192,28 +202,40 @@ def find_eo_band(
 
     This function looks into all assets and all eo bands for the given name and role.
     """
-    results = []
+    return _select_band_location(
+        eo_band_name, _eo_bands_index(item, role=role).get(eo_band_name, [])
+    )
+
+
+def _eo_bands_index(
+    item: pystac.Item,
+    role: Literal["data", "reflectance", "visual"] = "data",
+) -> Dict[str, List[Tuple[str, int, pystac.Asset]]]:
+    """
+    Map EO band names and common names to all assets and band indexes providing them.
+    """
+    index: Dict[str, List[Tuple[str, int, pystac.Asset]]] = defaultdict(list)
     for asset_name, asset in item.assets.items():
+        # if role is given, make sure it matches with desired role
+        if asset.roles is not None and role not in asset.roles:
+            continue
         # search in eo:bands and alternatively in bands for eo:common_name
         for band_index, band_info in enumerate(
             asset.extra_fields.get("eo:bands", asset.extra_fields.get("bands", [])), 1
         ):
-            if (
-                # if name matches eo band name
-                (
-                    eo_band_name == band_info.get("name")
-                    or eo_band_name == band_info.get("eo:common_name")
-                )
-                # if role is given, make sure it matches with desired role
-                and (asset.roles is None or role in asset.roles)
-            ):
-                results.append(
-                    BandLocation.from_asset(
-                        name=asset_name,
-                        band_index=band_index,
-                        asset=asset,
-                    )
-                )
+            for name in {band_info.get("name"), band_info.get("eo:common_name")}:
+                if name is not None:
+                    index[name].append((asset_name, band_index, asset))
+    return index
+
+
+def _select_band_location(
+    eo_band_name: str, candidates: List[Tuple[str, int, pystac.Asset]]
+) -> BandLocation:
+    results = [
+        BandLocation.from_asset(name=asset_name, band_index=band_index, asset=asset)
+        for asset_name, band_index, asset in candidates
+    ]
 
     if len(results) == 0:
         raise KeyError(f"EO band {eo_band_name} not found in item assets")
@@ -1,6 +1,7 @@
 import json
 import logging
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any, Callable, Dict, Generator, List, Optional, Type, Union
 
 from pydantic import BaseModel
@@ -48,13 +49,25 @@ class CatalogSearcher(ABC):
     This class serves as a bridge between an Archive and a catalog implementation.
     """
 
-    eo_bands: List[str]
-    id: str
-    description: str
-    stac_extensions: List[str]
     collections: List[str]
     config_cls: Type[BaseModel]
 
+    @property
+    @abstractmethod
+    def eo_bands(self) -> List[str]: ...
+
+    @property
+    @abstractmethod
+    def id(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def description(self) -> str: ...
+
+    @property
+    @abstractmethod
+    def stac_extensions(self) -> List[str]: ...
+
     @abstractmethod
     def search(
         self,
@@ -65,12 +78,43 @@ class CatalogSearcher(ABC):
     ) -> Generator[Item, None, None]: ...
 
 
-class StaticCatalogWriterMixin(CatalogSearcher):
-    client: Client
-    id: str
-    description: str
-    stac_extensions: List[str]
+class LazyCatalogMixin(CatalogSearcher):
+    """
+    Only access the catalog endpoint once its client or metadata is requested.
+
+    This way catalogs can e.g. be defined as archive class attributes without sending
+    requests when importing a module.
+    """
 
+    def _open_client(self) -> Client:  # pragma: no cover
+        raise NotImplementedError(f"{type(self).__name__} does not provide a client")
+
+    @abstractmethod
+    def _eo_bands(self) -> List[str]:  # pragma: no cover
+        ...
+
+    @cached_property
+    def client(self) -> Client:
+        return self._open_client()
+
+    @property
+    def id(self) -> str:
+        return self.client.id
+
+    @property
+    def description(self) -> str:
+        return self.client.description
+
+    @property
+    def stac_extensions(self) -> List[str]:
+        return self.client.stac_extensions
+
+    @cached_property
+    def eo_bands(self) -> List[str]:
+        return self._eo_bands()
+
+
+class StaticCatalogWriterMixin(CatalogSearcher):
     @abstractmethod
     def get_collections(self) -> List[Collection]:  # pragma: no cover
         ...
@@ -192,10 +236,10 @@ class StaticCatalogWriterMixin(CatalogSearcher):
             )
 
             # finally, add all items to collection
-            for item in items:
-                out_collection.add_item(item)
-
-            out_collection.update_extent_from_items()
+            # NOTE: the collection extent was already calculated from the very same
+            # items above, so there is no need to walk over all item links again by
+            # calling out_collection.update_extent_from_items()
+            out_collection.add_items(items)
 
             catalog.add_child(out_collection)
 
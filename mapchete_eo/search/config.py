@@ -8,12 +8,14 @@ class StacSearchConfig(BaseModel):
     max_cloud_cover: float = 100.0
     catalog_chunk_threshold: int = 10_000
     catalog_chunk_zoom: int = 5
+    catalog_parallel_requests: int = 8
     catalog_pagesize: int = 100
     footprint_buffer: float = 0
 
 
 class StacStaticConfig(BaseModel):
     max_cloud_cover: float = 100.0
+    catalog_parallel_requests: int = 8
 
 
 class UTMSearchConfig(BaseModel):
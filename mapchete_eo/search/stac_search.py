@@ -1,27 +1,76 @@
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from functools import cached_property
-from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Set, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from mapchete import Timer
 from mapchete.path import MPathLike
 from mapchete.tile import BufferedTilePyramid
 from mapchete.types import Bounds, BoundsLike
 from pystac import Item
-from pystac_client import Client
+from pystac_client import Client, ItemSearch
 from shapely.geometry import shape
 from shapely.geometry.base import BaseGeometry
 
 from mapchete_eo.product import blacklist_products
-from mapchete_eo.search.base import CatalogSearcher, StaticCatalogWriterMixin
+from mapchete_eo.search.base import (
+    CatalogSearcher,
+    LazyCatalogMixin,
+    StaticCatalogWriterMixin,
+)
 from mapchete_eo.search.config import StacSearchConfig
 from mapchete_eo.settings import mapchete_eo_settings
+from mapchete_eo.time import to_datetime
 from mapchete_eo.types import TimeRange
 
 logger = logging.getLogger(__name__)
 
 
-class STACSearchCatalog(StaticCatalogWriterMixin, CatalogSearcher):
+# API clients per endpoint, so the landing page and its conformance classes only have
+# to be requested once per process
+_clients: Dict[str, Client] = dict()
+
+
+def _get_client(endpoint: MPathLike) -> Client:
+    key = str(endpoint)
+    if key not in _clients:
+        _clients[key] = Client.open(key)
+    return _clients[key]
+
+
+# remember per (endpoint, collection) whether eo:bands are available, so this only has
+# to be looked up once per process instead of for every new catalog instance
+_collection_has_eo_bands: Dict[Tuple[Optional[str], str], bool] = dict()
+
+
+# raw items of recent API searches, so repeating an identical search within the same
+# process (e.g. when initializing multiple inputs on the same area) does not have to
+# request the API again
+_search_results: Dict[Tuple[Any, ...], List[dict]] = dict()
+
+
+def _item_sort_key(item: Item) -> Tuple[datetime, str]:
+    return (
+        item.datetime
+        or item.common_metadata.start_datetime
+        or datetime.min.replace(tzinfo=timezone.utc),
+        item.id,
+    )
+
+
+class STACSearchCatalog(LazyCatalogMixin, StaticCatalogWriterMixin, CatalogSearcher):
     endpoint: str
     blacklist: Set[str] = (
         blacklist_products(mapchete_eo_settings.blacklist)
@@ -40,13 +89,12 @@ class STACSearchCatalog(StaticCatalogWriterMixin, CatalogSearcher):
             self.collections = collections
         else:  # pragma: no cover
             raise ValueError("collections must be given")
-        self.client = Client.open(endpoint or self.endpoint)
-        self.id = self.client.id
-        self.description = self.client.description
-        self.stac_extensions = self.client.stac_extensions
-        self.eo_bands = self._eo_bands()
+        self.endpoint = str(endpoint or self.endpoint)
         self.stac_item_modifiers = stac_item_modifiers
 
+    def _open_client(self) -> Client:
+        return _get_client(self.endpoint)
+
     def search(
         self,
         time: Optional[Union[TimeRange, List[TimeRange]]] = None,
@@ -65,62 +113,187 @@ class STACSearchCatalog(StaticCatalogWriterMixin, CatalogSearcher):
         if area is not None and area.is_empty:  # pragma: no cover
             return
 
-        def _searches():
+        def _search_items() -> Generator[Item, None, None]:
             for time_range in time if isinstance(time, list) else [time]:
-                search = self._search(
+                yield from self._cached_search_items(
                     time_range=time_range, bounds=bounds, area=area, config=config
                 )
-                logger.debug("found %s products", search.matched())
-                matched = search.matched() or 0
-                if matched > config.catalog_chunk_threshold:
-                    spatial_search_chunks = SpatialSearchChunks(
-                        bounds=bounds,
-                        area=area,
-                        grid="geodetic",
-                        zoom=config.catalog_chunk_zoom,
-                    )
-                    logger.debug(
-                        "too many products (%s), query catalog in %s chunks",
-                        matched,
-                        len(spatial_search_chunks),
-                    )
-                    for counter, chunk_kwargs in enumerate(spatial_search_chunks, 1):
-                        with Timer() as duration:
-                            chunk_search = self._search(
-                                time_range=time_range,
-                                config=config,
-                                **chunk_kwargs,
-                            )
-                            yield chunk_search
-                        logger.debug(
-                            "returned chunk %s/%s (%s items) in %s",
-                            counter,
-                            len(spatial_search_chunks),
-                            chunk_search.matched(),
-                            duration,
-                        )
-                else:
-                    yield search
-
-        for search in _searches():
-            for count, item in enumerate(search.items(), 1):
-                item_path = item.get_self_href()
-                # logger.debug("item %s/%s ...", count, search.matched())
-                if item_path in self.blacklist:  # pragma: no cover
-                    logger.debug("item %s found in blacklist and skipping", item_path)
-                else:
-                    yield item
+
+        for item in _search_items():
+            item_path = item.get_self_href()
+            if item_path in self.blacklist:  # pragma: no cover
+                logger.debug("item %s found in blacklist and skipping", item_path)
+            else:
+                yield item
+
+    def _cached_search_items(
+        self,
+        time_range: TimeRange,
+        bounds: Optional[Bounds] = None,
+        area: Optional[BaseGeometry] = None,
+        config: StacSearchConfig = StacSearchConfig(),
+    ) -> Generator[Item, None, None]:
+        """Search items but reuse the results of an identical previous search."""
+
+        def _search_items() -> Generator[Item, None, None]:
+            yield from self._concurrent_search_items(
+                self._split_searches(
+                    time_range=time_range, bounds=bounds, area=area, config=config
+                ),
+                config=config,
+            )
+
+        if mapchete_eo_settings.stac_search_cache_size <= 0:
+            yield from _search_items()
+            return
+
+        key = (
+            self.client.get_self_href(),
+            tuple(self.collections),
+            str(time_range.start),
+            str(time_range.end),
+            None if bounds is None else tuple(bounds),
+            None if area is None else area.wkb,
+            config.model_dump_json(),
+        )
+        if key in _search_results:
+            logger.debug("reuse cached search results")
+            # items are newly created from the cached dictionaries, so modifying them
+            # does not affect the cache
+            for item_dict in _search_results[key]:
+                yield Item.from_dict(item_dict, root=self.client)
+            return
+
+        # keep on yielding items while collecting them and only cache complete results
+        item_dicts = []
+        for item in _search_items():
+            item_dicts.append(item.to_dict(transform_hrefs=False))
+            yield item
+        _search_results[key] = item_dicts
+        # remove oldest search results
+        while len(_search_results) > mapchete_eo_settings.stac_search_cache_size:
+            _search_results.pop(next(iter(_search_results)))
+
+    def _split_searches(
+        self,
+        time_range: TimeRange,
+        bounds: Optional[Bounds] = None,
+        area: Optional[BaseGeometry] = None,
+        config: StacSearchConfig = StacSearchConfig(),
+    ) -> List[ItemSearch]:
+        """
+        Split up search until each search matches no more than catalog_chunk_threshold items.
+
+        The time range is bisected first. Only if a single day still matches too many
+        items, the search is split up into spatial chunks.
+        """
+        search = self._search(
+            time_range=time_range, bounds=bounds, area=area, config=config
+        )
+        matched = search.matched() or 0
+        logger.debug("found %s products", matched)
+        if matched <= config.catalog_chunk_threshold:
+            return [search]
+
+        start = to_datetime(time_range.start).date()
+        end = to_datetime(time_range.end).date()
+        if start < end:
+            middle = start + timedelta(days=(end - start).days // 2)
+            logger.debug(
+                "too many products (%s), split time range %s/%s at %s",
+                matched,
+                start,
+                end,
+                middle,
+            )
+            return [
+                *self._split_searches(
+                    time_range=TimeRange(start=start, end=middle),
+                    bounds=bounds,
+                    area=area,
+                    config=config,
+                ),
+                *self._split_searches(
+                    time_range=TimeRange(start=middle + timedelta(days=1), end=end),
+                    bounds=bounds,
+                    area=area,
+                    config=config,
+                ),
+            ]
+
+        spatial_search_chunks = SpatialSearchChunks(
+            bounds=bounds,
+            area=area,
+            grid="geodetic",
+            zoom=config.catalog_chunk_zoom,
+        )
+        logger.debug(
+            "too many products (%s) on %s, query catalog in %s chunks",
+            matched,
+            start,
+            len(spatial_search_chunks),
+        )
+        return [
+            self._search(time_range=time_range, config=config, **chunk_kwargs)
+            for chunk_kwargs in spatial_search_chunks
+        ]
+
+    def _concurrent_search_items(
+        self,
+        searches: List[ItemSearch],
+        config: StacSearchConfig = StacSearchConfig(),
+    ) -> Generator[Item, None, None]:
+        """
+        Fetch items of all searches concurrently and yield them like a single search.
+
+        Fetching the result pages is dominated by HTTP latency, so the searches are run
+        in a thread pool. Items found by multiple searches are only yielded once and
+        all items are sorted newest first, which is the default sort order of STAC APIs.
+        """
+        if len(searches) == 1:
+            yield from searches[0].items()
+            return
+
+        def _search_items(counter_search: Tuple[int, ItemSearch]) -> List[Item]:
+            counter, search = counter_search
+            with Timer() as duration:
+                items = list(search.items())
+            logger.debug(
+                "returned search chunk %s/%s (%s items) in %s",
+                counter,
+                len(searches),
+                len(items),
+                duration,
+            )
+            return items
+
+        with ThreadPoolExecutor(
+            max_workers=config.catalog_parallel_requests
+        ) as executor:
+            search_results = list(executor.map(_search_items, enumerate(searches, 1)))
+
+        # spatial chunks can return the same items
+        items: Dict[str, Item] = dict()
+        for search_items in search_results:
+            for item in search_items:
+                items.setdefault(item.id, item)
+        yield from sorted(items.values(), key=_item_sort_key, reverse=True)
 
     def _eo_bands(self) -> List[str]:
         for collection_name in self.collections:
-            collection = self.client.get_collection(collection_name)
-            if collection:
-                item_assets = collection.extra_fields.get("item_assets", {})
-                for v in item_assets.values():
-                    if "eo:bands" in v and "data" in v.get("roles", []):
-                        return ["eo:bands"]
-            else:  # pragma: no cover
-                raise ValueError(f"cannot find collection {collection}")
+            key = (self.client.get_self_href(), collection_name)
+            if key not in _collection_has_eo_bands:
+                collection = self.client.get_collection(collection_name)
+                if collection:
+                    item_assets = collection.extra_fields.get("item_assets", {})
+                    _collection_has_eo_bands[key] = any(
+                        "eo:bands" in v and "data" in v.get("roles", [])
+                        for v in item_assets.values()
+                    )
+                else:  # pragma: no cover
+                    raise ValueError(f"cannot find collection {collection}")
+            if _collection_has_eo_bands[key]:
+                return ["eo:bands"]
         else:  # pragma: no cover
             logger.debug("cannot find eo:bands definition from collections")
             return []
@@ -234,10 +407,17 @@ class SpatialSearchChunks:
                     self.tile_pyramid.right,
                     self.bounds.top,
                 )
-            return [
-                list(Bounds.from_inp(tile.bbox.intersection(shape(bounds))))
-                for tile in self.tile_pyramid.tiles_from_bounds(bounds, zoom=self.zoom)
-            ]
+            chunks = []
+            for tile in self.tile_pyramid.tiles_from_bounds(bounds, zoom=self.zoom):
+                # intersect axis-aligned bounds directly without shapely geometries
+                left = max(tile.bounds.left, bounds.left)
+                bottom = max(tile.bounds.bottom, bounds.bottom)
+                right = min(tile.bounds.right, bounds.right)
+                top = min(tile.bounds.top, bounds.top)
+                # skip tiles only touching the search bounds
+                if left < right and bottom < top:
+                    chunks.append(list(map(float, (left, bottom, right, top))))
+            return chunks
         else:
             return [
                 tile.bbox.intersection(self.area)
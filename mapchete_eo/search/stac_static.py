@@ -1,25 +1,32 @@
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, Generator, List, Optional, Union
 
+import numpy as np
 from mapchete import Bounds
 from mapchete.types import BoundsLike
 from pystac import Item, Catalog, Collection
-from mapchete.io.vector import bounds_intersect
 from mapchete.path import MPathLike
 from pystac.stac_io import StacIO
 from pystac_client import Client
-from shapely.geometry import shape
+from shapely import STRtree
+from shapely.geometry import box, shape
 from shapely.geometry.base import BaseGeometry
 
 from mapchete_eo.search.base import (
     CatalogSearcher,
     FSSpecStacIO,
+    LazyCatalogMixin,
     StaticCatalogWriterMixin,
     filter_items,
 )
 from mapchete_eo.search.config import StacStaticConfig
-from mapchete_eo.time import time_ranges_intersect
+from mapchete_eo.time import (
+    time_ranges_intersect,
+    time_ranges_intersect_bulk,
+    to_datetime64,
+)
 from mapchete_eo.types import TimeRange
 
 logger = logging.getLogger(__name__)
@@ -27,8 +34,10 @@ logger = logging.getLogger(__name__)
 
 StacIO.set_default(FSSpecStacIO)
 
+_catalog_eo_bands: Dict[str, List[str]] = dict()
+
 
-class STACStaticCatalog(StaticCatalogWriterMixin, CatalogSearcher):
+class STACStaticCatalog(LazyCatalogMixin, StaticCatalogWriterMixin, CatalogSearcher):
     config_cls = StacStaticConfig
 
     def __init__(
@@ -37,12 +46,19 @@ class STACStaticCatalog(StaticCatalogWriterMixin, CatalogSearcher):
         stac_item_modifiers: Optional[List[Callable[[Item], Item]]] = None,
     ):
         self.client = Client.from_file(str(baseurl), stac_io=FSSpecStacIO())
-        self.id = self.client.id
-        self.description = self.client.description
-        self.stac_extensions = self.client.stac_extensions
         self.collections = [c.id for c in self.client.get_children()]
-        self.eo_bands = self._eo_bands()
+        # eo:bands only have to be looked up once per process for each catalog, but
+        # catalogs without a self href cannot be told apart and are not cached
+        catalog_href = self.client.get_self_href()
+        if catalog_href is None:
+            self.eo_bands = self._eo_bands()
+        else:
+            if catalog_href not in _catalog_eo_bands:
+                _catalog_eo_bands[catalog_href] = self._eo_bands()
+            self.eo_bands = list(_catalog_eo_bands[catalog_href])
         self.stac_item_modifiers = stac_item_modifiers
+        # item indexes of all collections and catalogs, built on first search
+        self._item_indexes: Dict[str, _ItemIndex] = dict()
 
     def search(
         self,
@@ -56,7 +72,7 @@ class STACStaticCatalog(StaticCatalogWriterMixin, CatalogSearcher):
             bounds = Bounds.from_inp(bounds)
             area = shape(bounds)
         for item in filter_items(
-            self._raw_search(time=time, area=area),
+            self._raw_search(time=time, area=area, config=config),
             max_cloud_cover=config.max_cloud_cover,
         ):
             yield item
@@ -65,9 +81,15 @@ class STACStaticCatalog(StaticCatalogWriterMixin, CatalogSearcher):
         self,
         time: Optional[Union[TimeRange, List[TimeRange]]] = None,
         area: Optional[BaseGeometry] = None,
+        config: Optional[StacStaticConfig] = None,
     ) -> Generator[Item, None, None]:
         if area is not None and area.is_empty:
             return
+        if area is not None and area.covers(box(-180, -90, 180, 90)):
+            # every item intersects, so don't bother checking footprints
+            logger.debug("area covers whole catalog CRS extent, skip spatial filter")
+            area = None
+        config = config or self.config_cls()
         logger.debug("iterate through children")
         for collection in self.client.get_collections():
             if time:
@@ -76,6 +98,8 @@ class STACStaticCatalog(StaticCatalogWriterMixin, CatalogSearcher):
                         collection,
                         area=area,
                         time_range=time_range,
+                        parallel_requests=config.catalog_parallel_requests,
+                        item_indexes=self._item_indexes,
                     ):
                         item.make_asset_hrefs_absolute()
                         yield item
@@ -83,6 +107,8 @@ class STACStaticCatalog(StaticCatalogWriterMixin, CatalogSearcher):
                 for item in _all_intersecting_items(
                     collection,
                     area=area,
+                    parallel_requests=config.catalog_parallel_requests,
+                    item_indexes=self._item_indexes,
                 ):
                     item.make_asset_hrefs_absolute()
                     yield item
@@ -150,51 +176,99 @@ def _get_first_item(collections):
 
 def _all_intersecting_items(
     collection: Union[Catalog, Collection],
-    area: BaseGeometry,
+    area: Optional[BaseGeometry] = None,
     time_range: Optional[TimeRange] = None,
+    parallel_requests: int = 1,
+    item_indexes: Optional[Dict[str, "_ItemIndex"]] = None,
 ):
+    # skip collection items and children altogether if collection extent does not
+    # intersect (catalogs do not have an extent)
+    if isinstance(collection, Collection) and not _collection_extent_intersects(
+        collection, area=area, time_range=time_range
+    ):
+        logger.debug("collection %s does not intersect", collection.id)
+        return
+
     # collection items
     logger.debug("checking items...")
-    for item in collection.get_items():
-        # yield item if it intersects with extent
-        logger.debug("item %s", item.id)
-        if _item_extent_intersects(item, area=area, time_range=time_range):
-            logger.debug("item %s within search parameters", item.id)
-            yield item
+    item_indexes = dict() if item_indexes is None else item_indexes
+    index_key = collection.get_self_href() or collection.id
+    if index_key not in item_indexes:
+        _resolve_item_links(collection, parallel_requests=parallel_requests)
+        item_indexes[index_key] = _ItemIndex(list(collection.get_items()))
+    for item in item_indexes[index_key].query(area=area, time_range=time_range):
+        logger.debug("item %s within search parameters", item.id)
+        yield item
 
     # collection children
     logger.debug("checking collections...")
     for child in collection.get_children():
-        # yield collection if it intersects with extent
-        logger.debug("collection %s", collection.id)
-        if _collection_extent_intersects(child, area=area, time_range=time_range):
-            logger.debug("found catalog %s with intersecting items", child.id)
-            yield from _all_intersecting_items(child, area=area, time_range=time_range)
+        logger.debug("collection %s", child.id)
+        yield from _all_intersecting_items(
+            child,
+            area=area,
+            time_range=time_range,
+            parallel_requests=parallel_requests,
+            item_indexes=item_indexes,
+        )
 
 
-def _item_extent_intersects(
-    item: Item,
-    area: Optional[BaseGeometry] = None,
-    time_range: Optional[TimeRange] = None,
-) -> bool:
-    # NOTE: bounds intersect is faster but in the current implementation cannot
-    # handle item footprints going over the Antimeridian (and have been split up into
-    # MultiPolygon geometries)
-    # spatial_intersect = bounds_intersect(item.bbox, bounds) if bounds else True
-    spatial_intersect = shape(item.geometry).intersects(area) if area else True
-    if time_range and item.datetime:
-        temporal_intersect = time_ranges_intersect(
-            (item.datetime, item.datetime), (time_range.start, time_range.end)
+def _resolve_item_links(
+    collection: Union[Catalog, Collection], parallel_requests: int = 1
+) -> None:
+    """Read all not yet resolved item JSONs of a collection concurrently."""
+    links = [link for link in collection.get_item_links() if not link.is_resolved()]
+    if parallel_requests <= 1 or len(links) <= 1:
+        return
+    root = collection.get_root()
+    with ThreadPoolExecutor(max_workers=parallel_requests) as executor:
+        # pystac.Catalog.get_items() will then use the already resolved items
+        list(executor.map(lambda link: link.resolve_stac_object(root=root), links))
+
+
+class _ItemIndex:
+    """Spatial and temporal index of the items of one collection."""
+
+    def __init__(self, items: List[Item]):
+        self.items = items
+        # items can either have a single timestamp or a start and end timestamp,
+        # items without timestamps cannot be filtered temporally and are always kept
+        self.starts = to_datetime64(
+            [item.datetime or item.common_metadata.start_datetime for item in items],
+            "min",
         )
-        logger.debug(
-            "spatial intersect: %s, temporal intersect: %s",
-            spatial_intersect,
-            temporal_intersect,
+        self.ends = to_datetime64(
+            [item.datetime or item.common_metadata.end_datetime for item in items],
+            "max",
         )
-        return spatial_intersect and temporal_intersect
-    else:
-        logger.debug("spatial intersect: %s", spatial_intersect)
-        return spatial_intersect
+        self._tree: Optional[STRtree] = None
+
+    @property
+    def tree(self) -> STRtree:
+        if self._tree is None:
+            # NOTE: item footprints are used instead of bounding boxes because these
+            # can also handle footprints going over the Antimeridian
+            self._tree = STRtree([shape(item.geometry) for item in self.items])
+        return self._tree
+
+    def query(
+        self,
+        area: Optional[BaseGeometry] = None,
+        time_range: Optional[TimeRange] = None,
+    ) -> List[Item]:
+        """Return items intersecting with area and time range in original order."""
+        if not self.items:
+            return []
+        intersects = np.ones(len(self.items), dtype=bool)
+        if time_range is not None:
+            intersects &= time_ranges_intersect_bulk(
+                self.starts, self.ends, time_range.start, time_range.end
+            )
+        if area is not None:
+            spatially_intersects = np.zeros(len(self.items), dtype=bool)
+            spatially_intersects[self.tree.query(area, predicate="intersects")] = True
+            intersects &= spatially_intersects
+        return [item for item, intersect in zip(self.items, intersects) if intersect]
 
 
 def _collection_extent_intersects(
@@ -205,8 +279,10 @@ def _collection_extent_intersects(
     """
 
     def _intersects_spatially():
-        for b in catalog.extent.spatial.to_dict().get("bbox", [[]]):
-            if bounds_intersect(area.bounds, b):
+        left, bottom, right, top = area.bounds
+        for b in catalog.extent.spatial.bboxes:
+            # plain comparison of bounds values, touching extents also intersect
+            if not (b[2] < left or b[0] > right or b[3] < bottom or b[1] > top):
                 logger.debug("spatial intersect: True")
                 return True
         else:
@@ -214,7 +290,7 @@ def _collection_extent_intersects(
             return False
 
     def _intersects_temporally():
-        for t in catalog.extent.temporal.to_dict().get("interval", [[]]):
+        for t in catalog.extent.temporal.intervals:
             if time_ranges_intersect((time_range.start, time_range.end), t):
                 logger.debug("temporal intersect: True")
                 return True
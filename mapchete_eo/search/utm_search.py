@@ -15,6 +15,7 @@ from mapchete_eo.exceptions import ItemGeometryError
 from mapchete_eo.product import blacklist_products
 from mapchete_eo.search.base import (
     CatalogSearcher,
+    LazyCatalogMixin,
     StaticCatalogWriterMixin,
     filter_items,
 )
@@ -27,7 +28,7 @@ from mapchete_eo.types import TimeRange
 logger = logging.getLogger(__name__)
 
 
-class UTMSearchCatalog(StaticCatalogWriterMixin, CatalogSearcher):
+class UTMSearchCatalog(LazyCatalogMixin, StaticCatalogWriterMixin, CatalogSearcher):
     endpoint: str
     id: str
     day_subdir_schema: str
@@ -51,7 +52,6 @@ class UTMSearchCatalog(StaticCatalogWriterMixin, CatalogSearcher):
         if len(collections) == 0:  # pragma: no cover
             raise ValueError("no collections provided")
         self.collections = collections
-        self.eo_bands = self._eo_bands()
         self.stac_item_modifiers = stac_item_modifiers
 
     def search(
@@ -154,7 +154,7 @@ class UTMSearchCatalog(StaticCatalogWriterMixin, CatalogSearcher):
             ) in UTMSearchConfig().sinergise_aws_collections.values():
                 if collection_properties["id"] == collection_name:
                     collection = Collection.from_dict(
-                        collection_properties["path"].read_json()
+                        collection_properties["path"].read_json(), preserve_dict=False
                     )
                     if collection:
                         summary = collection.summaries.to_dict()
@@ -177,7 +177,9 @@ class UTMSearchCatalog(StaticCatalogWriterMixin, CatalogSearcher):
             etc.
         """
         for collection_properties in self.config.sinergise_aws_collections.values():
-            collection = Collection.from_dict(collection_properties["path"].read_json())
+            collection = Collection.from_dict(
+                collection_properties["path"].read_json(), preserve_dict=False
+            )
             for collection_name in self.collections:
                 if collection_name == collection.id:
                     yield collection
@@ -210,7 +212,8 @@ def items_from_static_index(
 
                     if start_time <= timestamp <= end_time:
                         yield Item.from_dict(
-                            MPath.from_inp(item_feature.properties["path"]).read_json()
+                            MPath.from_inp(item_feature.properties["path"]).read_json(),
+                            preserve_dict=False,
                         )
 
 
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Union
 
 from mapchete.path import MPath, MPathLike
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,6 +16,14 @@ class Settings(BaseSettings):
     default_cache_location: MPathLike = MPath("s3://eox-mhub-cache/")
     default_catalog_crs: CRS = CRS.from_epsg(4326)
     blacklist: Optional[MPathLike] = None
+    # maximum number of assets read concurrently per item
+    io_threads: int = 16
+    # GDAL_NUM_THREADS used to decode a single asset, this is kept low by default as
+    # assets of an item are already read concurrently (see io_threads)
+    gdal_num_threads: Union[int, str] = 1
+    # number of STAC API search results kept in memory per process, this is disabled by
+    # default as all items of a cached search are kept for the lifetime of the process
+    stac_search_cache_size: int = 0
 
     # read from environment
     model_config = SettingsConfigDict(env_prefix="MAPCHETE_EO_")
@@ -1,11 +1,14 @@
 import datetime
-from typing import List, Tuple, Union
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
 
 import dateutil.parser
+import numpy as np
 
 from mapchete_eo.types import DateTimeLike
 
-_time = {"min": datetime.datetime.min.time(), "max": datetime.datetime.max.time()}
+_MIN_TIME = datetime.datetime.min.time()
+_MAX_TIME = datetime.datetime.max.time()
 
 
 def to_datetime(t: DateTimeLike, append_time="min") -> datetime.datetime:
@@ -13,21 +16,76 @@ def to_datetime(t: DateTimeLike, append_time="min") -> datetime.datetime:
     if isinstance(t, datetime.datetime):
         return t
     elif isinstance(t, datetime.date):
-        return datetime.datetime.combine(t, _time[append_time])
+        return datetime.datetime.combine(
+            t, _MIN_TIME if append_time == "min" else _MAX_TIME
+        )
     else:
+        return _parse_datetime(t)
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(t: str) -> datetime.datetime:
+    # ISO 8601 strings are by far the most common input and much faster to parse using
+    # the standard library, dateutil is only used as fallback
+    try:
+        return datetime.datetime.fromisoformat(t.replace("Z", "+00:00"))
+    except ValueError:
         return dateutil.parser.parse(t)
 
 
 def time_ranges_intersect(
-    t1: Tuple[DateTimeLike, DateTimeLike],
-    t2: Tuple[DateTimeLike, DateTimeLike],
+    t1: Tuple[Optional[DateTimeLike], Optional[DateTimeLike]],
+    t2: Tuple[Optional[DateTimeLike], Optional[DateTimeLike]],
 ) -> bool:
     """Check if two time ranges intersect."""
-    t1_start = to_datetime(t1[0], "min").replace(tzinfo=None)
-    t1_end = to_datetime(t1[1], "max").replace(tzinfo=None)
-    t2_start = to_datetime(t2[0], "min").replace(tzinfo=None)
-    t2_end = to_datetime(t2[1], "max").replace(tzinfo=None)
-    return (t1_start <= t2_start <= t1_end) or (t2_start <= t1_start <= t2_end)
+    return _as_naive(t1[0], "min") <= _as_naive(t2[1], "max") and _as_naive(
+        t2[0], "min"
+    ) <= _as_naive(t1[1], "max")
+
+
+@lru_cache(maxsize=4096)
+def _as_naive(t: Optional[DateTimeLike], append_time: str = "min") -> datetime.datetime:
+    # open ended time ranges (e.g. STAC collection temporal extents) use None
+    if t is None:
+        return datetime.datetime.min if append_time == "min" else datetime.datetime.max
+    dt = to_datetime(t, append_time)
+    # convert to UTC first, as aware datetimes with different offsets but describing
+    # the same instant are equal and therefore share the same cache entry
+    return (
+        dt
+        if dt.tzinfo is None
+        else dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    )
+
+
+def time_ranges_intersect_bulk(
+    starts: Union[Sequence[Optional[DateTimeLike]], np.ndarray],
+    ends: Union[Sequence[Optional[DateTimeLike]], np.ndarray],
+    start: Optional[DateTimeLike],
+    end: Optional[DateTimeLike],
+) -> np.ndarray:
+    """
+    Check which of multiple time ranges intersect with one time range at once.
+
+    Starts and ends can also be passed on as already converted datetime64 arrays.
+    Returns a boolean array. Missing boundaries (None) are treated as open ended.
+    """
+    return (to_datetime64(ends, "max") >= np.datetime64(_as_naive(start, "min"))) & (
+        to_datetime64(starts, "min") <= np.datetime64(_as_naive(end, "max"))
+    )
+
+
+def to_datetime64(
+    timestamps: Union[Sequence[Optional[DateTimeLike]], np.ndarray],
+    append_time: str = "min",
+) -> np.ndarray:
+    """Convert timestamps into a naive datetime64 array."""
+    if isinstance(timestamps, np.ndarray):
+        return timestamps.astype("datetime64[us]", copy=False)
+    # microsecond precision is required to also represent datetime.min and datetime.max
+    return np.array(
+        [_as_naive(t, append_time) for t in timestamps], dtype="datetime64[us]"
+    )
 
 
 def timedelta(date: DateTimeLike, target: DateTimeLike, seconds: bool = True):
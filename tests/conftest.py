@@ -1,3 +1,4 @@
+import json
 import os
 
 import numpy as np
@@ -7,6 +8,7 @@ import pytest
 from mapchete.path import MPath
 from mapchete.testing import ProcessFixture
 from mapchete.tile import BufferedTilePyramid
+from pystac.utils import make_absolute_href
 from pystac_client import Client
 from rasterio import Affine
 from shapely import wkt
@@ -18,6 +20,22 @@ from mapchete_eo.search import STACSearchCatalog, STACStaticCatalog
 from mapchete_eo.types import TimeRange
 
 
+# raw STAC item JSON, so every item is only read once per test session
+_ITEM_JSONS: dict = {}
+
+
+def _cached_item(href: str) -> pystac.Item:
+    """Return a new pystac.Item but read its JSON only once per test session."""
+    href = make_absolute_href(str(href))
+    if href not in _ITEM_JSONS:
+        _ITEM_JSONS[href] = pystac.StacIO.default().read_text(href)
+    # parsing the JSON string again is faster than letting pystac deepcopy a cached
+    # dictionary and also guarantees tests cannot modify the cached item
+    return pystac.Item.from_dict(
+        json.loads(_ITEM_JSONS[href]), href=href, migrate=True, preserve_dict=False
+    )
+
+
 @pytest.fixture
 def tmp_mpath(tmp_path):
     return MPath.from_inp(tmp_path)
@@ -47,9 +65,10 @@ def s2_stac_collection(s2_testdata_dir):
 def s2_stac_items(s2_stac_collection):
     client = Client.from_file(str(s2_stac_collection))
     collection = next(client.get_collections())
-    items = [item for item in collection.get_items()]
-    for item in items:
+    items = []
+    for item in collection.get_items():
         item.make_asset_hrefs_absolute()
+        items.append(item)
     return items
 
 
@@ -69,22 +88,34 @@ def pf_qa_stac_collection(testdata_dir):
     return testdata_dir / "pf_stac_collection" / "stac" / "QA" / "catalog.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_2d_array() -> ma.MaskedArray:
-    data = np.random.randint(low=0, high=255, size=(256, 256), dtype=np.uint8)
-    return ma.MaskedArray(
-        data=data, mask=np.where(data <= 100, True, False), fill_value=0
+    data = np.random.default_rng(0).integers(
+        low=0, high=255, size=(256, 256), dtype=np.uint8
     )
+    mask = data <= 100
+    # array is shared by all tests, so make sure it cannot be modified
+    data.setflags(write=False)
+    mask.setflags(write=False)
+    return ma.MaskedArray(data=data, mask=mask, fill_value=0)
 
 
 @pytest.fixture
 def test_3d_array(test_2d_array) -> ma.MaskedArray:
-    return ma.stack([test_2d_array for _ in range(3)])
+    shape = (3, *test_2d_array.shape)
+    return ma.MaskedArray(
+        data=np.broadcast_to(test_2d_array.data, shape).copy(),
+        mask=np.broadcast_to(test_2d_array.mask, shape).copy(),
+    )
 
 
 @pytest.fixture
 def test_4d_array(test_3d_array) -> ma.MaskedArray:
-    return ma.stack([test_3d_array for _ in range(5)])
+    shape = (5, *test_3d_array.shape)
+    return ma.MaskedArray(
+        data=np.broadcast_to(test_3d_array.data, shape).copy(),
+        mask=np.broadcast_to(test_3d_array.mask, shape).copy(),
+    )
 
 
 @pytest.fixture
@@ -104,7 +135,7 @@ def test_affine():
 
 @pytest.fixture
 def s2_stac_item(s2_stac_collection):
-    item = pystac.pystac.Item.from_file(
+    item = _cached_item(
         str(
             s2_stac_collection.parent
             / "sentinel-2-l2a"
@@ -118,7 +149,7 @@ def s2_stac_item(s2_stac_collection):
 
 @pytest.fixture
 def s2_stac_item_jp2():
-    item = pystac.pystac.Item.from_file(
+    item = _cached_item(
         "s3://sentinel-s2-l2a-stac/2023/08/10/S2B_OPER_MSI_L2A_TL_2BPS_20230810T130104_A033567_T33TWM.json"
     )
     item.make_asset_hrefs_absolute()
@@ -127,7 +158,7 @@ def s2_stac_item_jp2():
 
 @pytest.fixture
 def s2_stac_item_cdse_jp2():
-    item = pystac.pystac.Item.from_file(
+    item = _cached_item(
         "https://stac.dataspace.copernicus.eu/v1/collections/sentinel-2-l2a/items/S2B_MSIL2A_20230810T094549_N0509_R079_T33TWM_20230810T130104"
     )
     item.make_asset_hrefs_absolute()
@@ -136,7 +167,7 @@ def s2_stac_item_cdse_jp2():
 
 @pytest.fixture
 def s2_remote_stac_item():
-    item = pystac.pystac.Item.from_file(
+    item = _cached_item(
         "https://sentinel-cogs.s3.us-west-2.amazonaws.com/sentinel-s2-l2a-cogs/33/U/WP/2023/7/S2B_33UWP_20230704_0_L2A/S2B_33UWP_20230704_0_L2A.json"
     )
     return item
@@ -154,7 +185,7 @@ def s2_stac_json_half_footprint(s2_stac_collection):
 
 @pytest.fixture
 def s2_stac_item_half_footprint(s2_stac_json_half_footprint):
-    item = pystac.pystac.Item.from_file(str(s2_stac_json_half_footprint))
+    item = _cached_item(str(s2_stac_json_half_footprint))
     item.make_asset_hrefs_absolute()
     return item
 
@@ -312,21 +343,26 @@ def merge_rasters_mapchete(tmp_path, testdata_dir):
         yield example
 
 
-@pytest.fixture
-def cloudy_tile():
-    return BufferedTilePyramid("geodetic").tile(13, 1986, 8557)
+@pytest.fixture(scope="session")
+def geodetic_tile_pyramid():
+    return BufferedTilePyramid("geodetic")
 
 
-@pytest.fixture
-def test_tile():
+@pytest.fixture(scope="session")
+def cloudy_tile(geodetic_tile_pyramid):
+    return geodetic_tile_pyramid.tile(13, 1986, 8557)
+
+
+@pytest.fixture(scope="session")
+def test_tile(geodetic_tile_pyramid):
     """Tile on the overlap between MGRS granules 33TWL and 33TWM."""
-    return BufferedTilePyramid("geodetic").tile_from_xy(15.77928, 46.01972, 13)
+    return geodetic_tile_pyramid.tile_from_xy(15.77928, 46.01972, 13)
 
 
-@pytest.fixture
-def test_edge_tile():
+@pytest.fixture(scope="session")
+def test_edge_tile(geodetic_tile_pyramid):
     """Tile on the overlap between MGRS granules 33TWL and 33TWM but on the product edge."""
-    return BufferedTilePyramid("geodetic").tile_from_xy(15.00122, 45.98486, 13)
+    return geodetic_tile_pyramid.tile_from_xy(15.00122, 45.98486, 13)
 
 
 @pytest.fixture(scope="session")
@@ -462,7 +498,7 @@ def s2_l2a_earthsearch_remote(s2_l2a_earthsearch_remote_item):
 @pytest.fixture(scope="session")
 def s2_l2a_earthsearch_remote_item():
     """Metadata used by Earth-Search V1 endpoint"""
-    return pystac.Item.from_file(
+    return _cached_item(
         "https://sentinel-cogs.s3.us-west-2.amazonaws.com/sentinel-s2-l2a-cogs/33/T/WL/2022/6/S2A_33TWL_20220601_0_L2A/S2A_33TWL_20220601_0_L2A.json"
     )
 
@@ -479,7 +515,7 @@ def tileinfo_jp2_schema():
 
 @pytest.fixture(scope="session")
 def stac_item_brdf(s2_testdata_dir):
-    return pystac.Item.from_file(
+    return _cached_item(
         str(
             s2_testdata_dir
             / "stac_items"
@@ -492,7 +528,7 @@ def stac_item_brdf(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0509(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_32TMS_20221207_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_32TMS_20221207_0_L2A")
     )
 
@@ -500,7 +536,7 @@ def stac_item_pb0509(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0400(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_33TWN_20220130_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2B_33TWN_20220130_0_L2A")
     )
 
@@ -508,7 +544,7 @@ def stac_item_pb0400(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0400_offset(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_33TWN_20220226_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2B_33TWN_20220226_0_L2A")
     )
 
@@ -516,7 +552,7 @@ def stac_item_pb0400_offset(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0301(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_33TWN_20220122_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_33TWN_20220122_0_L2A")
     )
 
@@ -524,7 +560,7 @@ def stac_item_pb0301(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0300(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_33TWN_20210629_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_33TWN_20210629_0_L2A")
     )
 
@@ -532,7 +568,7 @@ def stac_item_pb0300(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0214(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_33TWN_20210328_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_33TWN_20210328_0_L2A")
     )
 
@@ -540,7 +576,7 @@ def stac_item_pb0214(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0213(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_33TWN_20200202_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_33TWN_20200202_0_L2A")
     )
 
@@ -548,7 +584,7 @@ def stac_item_pb0213(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0212(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_33TWN_20190707_1_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_33TWN_20190707_1_L2A")
     )
 
@@ -556,7 +592,7 @@ def stac_item_pb0212(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0211(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_33TWN_20190503_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2B_33TWN_20190503_0_L2A")
     )
 
@@ -564,7 +600,7 @@ def stac_item_pb0211(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0210(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_33TWN_20181119_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_33TWN_20181119_0_L2A")
     )
 
@@ -572,7 +608,7 @@ def stac_item_pb0210(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0209(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_33TWN_20181104_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2B_33TWN_20181104_0_L2A")
     )
 
@@ -580,7 +616,7 @@ def stac_item_pb0209(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0208(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_33TWN_20181005_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2B_33TWN_20181005_0_L2A")
     )
 
@@ -588,7 +624,7 @@ def stac_item_pb0208(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb0207(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_33TWN_20180521_1_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2B_33TWN_20180521_1_L2A")
     )
 
@@ -596,7 +632,7 @@ def stac_item_pb0207(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb_l1c_0206(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_33TWN_20180806_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2B_33TWN_20180806_0_L2A")
     )
 
@@ -604,7 +640,7 @@ def stac_item_pb_l1c_0206(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb_l1c_0205(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_33TWN_20171005_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_33TWN_20171005_0_L2A")
     )
 
@@ -612,7 +648,7 @@ def stac_item_pb_l1c_0205(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_pb_l1c_0204(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_33TWN_20161202_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2A_33TWN_20161202_0_L2A")
     )
 
@@ -620,14 +656,14 @@ def stac_item_pb_l1c_0204(s2_testdata_dir):
 @pytest.fixture(scope="session")
 def stac_item_invalid_pb0001(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_33TWN_20180806_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(s2_testdata_dir / "stac_items" / "S2B_33TWN_20180806_0_L2A")
     )
 
 
 @pytest.fixture(scope="session")
 def full_stac_item_pb0509(s2_testdata_dir):
-    return pystac.Item.from_file(
+    return _cached_item(
         s2_testdata_dir
         / "full_products"
         / "sentinel-2-l2a"
@@ -638,7 +674,7 @@ def full_stac_item_pb0509(s2_testdata_dir):
 
 @pytest.fixture(scope="session")
 def antimeridian_item1(testdata_dir):
-    return pystac.Item.from_file(
+    return _cached_item(
         testdata_dir
         / "antimeridian_items"
         / "S2A_OPER_MSI_L2A_TL_2APS_20230603T031757_A041497_T01WCQ.json"
@@ -647,7 +683,7 @@ def antimeridian_item1(testdata_dir):
 
 @pytest.fixture(scope="session")
 def antimeridian_item2(testdata_dir):
-    return pystac.Item.from_file(
+    return _cached_item(
         testdata_dir
         / "antimeridian_items"
         / "S2B_OPER_MSI_L2A_TL_2BPS_20230503T100334_A030615_T60VXH.json"
@@ -656,7 +692,7 @@ def antimeridian_item2(testdata_dir):
 
 @pytest.fixture(scope="session")
 def antimeridian_item3(testdata_dir):
-    return pystac.Item.from_file(
+    return _cached_item(
         testdata_dir
         / "antimeridian_items"
         / "S2B_OPER_MSI_L2A_TL_2BPS_20230512T234921_A032288_T01VCG.json"
@@ -665,7 +701,7 @@ def antimeridian_item3(testdata_dir):
 
 @pytest.fixture(scope="session")
 def antimeridian_item4(testdata_dir):
-    return pystac.Item.from_file(
+    return _cached_item(
         testdata_dir
         / "antimeridian_items"
         / "S2B_OPER_MSI_L2A_TL_2BPS_20230513T005426_A032288_T01VCG.json"
@@ -674,7 +710,7 @@ def antimeridian_item4(testdata_dir):
 
 @pytest.fixture(scope="session")
 def antimeridian_item5(testdata_dir):
-    return pystac.Item.from_file(
+    return _cached_item(
         testdata_dir
         / "antimeridian_items"
         / "S2A_OPER_MSI_L2A_TL_2APS_20230730T020155_A042312_T01VCC.json"
@@ -684,7 +720,7 @@ def antimeridian_item5(testdata_dir):
 @pytest.fixture(scope="session")
 def antimeridian_broken_item(testdata_dir):
     # this footprint is unfuckingfixable
-    return pystac.Item.from_file(
+    return _cached_item(
         testdata_dir
         / "antimeridian_items"
         / "S2A_OPER_MSI_L2A_TL_2APS_20230806T022123_A042412_T60VXH.json"
@@ -703,7 +739,7 @@ def product_missing_detector_footprints():
 
 @pytest.fixture(scope="session")
 def stac_item_missing_detector_footprints():
-    return pystac.Item.from_file(
+    return _cached_item(
         "https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2B_37WEP_20231017_0_L2A"
     )
 
@@ -717,13 +753,13 @@ def stac_item_path_sentinel2_jp2():
 
 @pytest.fixture(scope="session")
 def stac_item_sentinel2_jp2(stac_item_path_sentinel2_jp2):
-    return pystac.Item.from_file(stac_item_path_sentinel2_jp2)
+    return _cached_item(stac_item_path_sentinel2_jp2)
 
 
 @pytest.fixture(scope="session")
 def stac_item_sentinel2_jp2_local(s2_testdata_dir):
     """https://earth-search.aws.element84.com/v1/collections/sentinel-2-l2a/items/S2A_32TMS_20221207_0_L2A"""
-    return pystac.Item.from_file(
+    return _cached_item(
         str(
             s2_testdata_dir
             / "stac_items"
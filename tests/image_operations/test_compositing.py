@@ -1,6 +1,7 @@
 import numpy as np
 import numpy.ma as ma
 import pytest
+from rasterio.plot import reshape_as_image
 
 from mapchete_eo.image_operations import compositing, blend_functions
 
@@ -177,6 +178,19 @@ def test_composite_dispatch(test_3d_array, method):
     assert out.shape == (4, 256, 256)
 
 
+@pytest.mark.parametrize(
+    "blend_func", [func for func in BLEND_FUNCS if func is not blend_functions.normal]
+)
+def test_blend_functions_skip_transparent_layer(test_3d_array, blend_func):
+    # fully transparent layer must yield the same output as running the blend mode
+    fg = reshape_as_image(compositing.to_rgba(test_3d_array) / 255)
+    bg = reshape_as_image(compositing.to_rgba(test_3d_array[:, ::-1]) / 255)
+    out = blend_func(fg, bg, 0)
+    expected = blend_func.__wrapped__(fg, bg, 0)
+    assert out.dtype == expected.dtype
+    assert np.array_equal(out, expected)
+
+
 # ---------------------------
 # fuzzy_mask tests
 # ---------------------------
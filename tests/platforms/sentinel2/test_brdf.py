@@ -13,10 +13,9 @@ from mapchete_eo.platforms.sentinel2.types import (
 
 @pytest.mark.remote
 @pytest.mark.parametrize("per_detector", [True, False])
-def test_run_sentinel2_brdf(s2_l2a_metadata_xml, per_detector):
+def test_run_sentinel2_brdf(s2_l2a_metadata, per_detector):
     band = L2ABand.B02
-    metadata = S2Metadata.from_metadata_xml(s2_l2a_metadata_xml)
-    height, width = metadata.shape(resolution=Resolution["60m"])
+    height, width = s2_l2a_metadata.shape(resolution=Resolution["60m"])
     band_array = ma.masked_equal(
         np.concatenate(
             (
@@ -28,7 +27,7 @@ def test_run_sentinel2_brdf(s2_l2a_metadata_xml, per_detector):
         0,
     )
     brdf_params = correction_values(
-        s2_metadata=metadata,
+        s2_metadata=s2_l2a_metadata,
         band=band,
         model=BRDFModels.HLS,
         per_detector=per_detector,
@@ -42,7 +41,7 @@ def test_run_sentinel2_brdf(s2_l2a_metadata_xml, per_detector):
     assert np.allclose(band_array.mask, corrected_band.mask)
 
     brdf_params = correction_values(
-        s2_metadata=metadata,
+        s2_metadata=s2_l2a_metadata,
         band=band,
         model=BRDFModels.RossThick,
         per_detector=per_detector,
@@ -57,19 +56,17 @@ def test_run_sentinel2_brdf(s2_l2a_metadata_xml, per_detector):
 
 
 @pytest.mark.parametrize("band", [band for band in L2ABand if band != L2ABand.B10])
-def test_get_all_12_bands_brdf_param(s2_l2a_metadata_xml, band):
-    metadata = S2Metadata.from_metadata_xml(s2_l2a_metadata_xml)
+def test_get_all_12_bands_brdf_param(s2_l2a_metadata, band):
     corrected = correction_values(
-        s2_metadata=metadata, band=band, resolution=Resolution["120m"]
+        s2_metadata=s2_l2a_metadata, band=band, resolution=Resolution["120m"]
     ).array
     assert isinstance(corrected, ma.MaskedArray)
     assert not corrected.mask.all()
     # This Value should be below 1 for all bands in this particular product
     assert np.nanmean(corrected) < 1.0
 
-    metadata = S2Metadata.from_metadata_xml(s2_l2a_metadata_xml)
     corrected = correction_values(
-        s2_metadata=metadata,
+        s2_metadata=s2_l2a_metadata,
         band=band,
         resolution=Resolution["120m"],
         model=BRDFModels.RossThick,
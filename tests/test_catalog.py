@@ -1,17 +1,90 @@
+import datetime
+
+import pystac
 import pystac_client
+import pytest
 import rasterio
 from mapchete.io import fs_from_path, path_exists
 from mapchete.io.raster import rasterio_open
 from mapchete.path import MPath
+from mapchete.types import Bounds
 from shapely import box
 
 from mapchete_eo.known_catalogs import EarthSearchV1S2L2A, AWSSearchCatalogS2L2A
 from mapchete_eo.platforms.sentinel2 import S2Metadata
 from mapchete_eo.platforms.sentinel2.types import Resolution
-from mapchete_eo.search import STACStaticCatalog
+from mapchete_eo.search import STACSearchCatalog, STACStaticCatalog, stac_search
+from mapchete_eo.search.config import StacSearchConfig
+from mapchete_eo.settings import mapchete_eo_settings
+from mapchete_eo.time import day_range, to_datetime
 from mapchete_eo.types import TimeRange
 
 
+class _FakeItemSearch:
+    """Mimics pystac_client.ItemSearch on a list of items."""
+
+    def __init__(self, items, **params):
+        self.params = params
+        self._items = items
+
+    def matched(self):
+        return len(self._items)
+
+    def items(self):
+        return iter(self._items)
+
+
+class _FakeClient(pystac.Catalog):
+    """Mimics the item search of a STAC API, returning items newest first."""
+
+    def __init__(self, items):
+        super().__init__(id="fake", description="fake STAC API")
+        self._items = items
+        self.searches = []
+
+    def search(self, **params):
+        self.searches.append(params)
+        start, end = [
+            datetime.date.fromisoformat(t) for t in params["datetime"].split("/")
+        ]
+        bbox = params["bbox"]
+        if isinstance(bbox, str):
+            bbox = params["bbox"] = list(map(float, bbox.split(",")))
+        items = [
+            item
+            for item in self._items
+            if start <= item.datetime.date() <= end
+            and box(*item.bbox).intersects(box(*bbox))
+        ]
+        return _FakeItemSearch(
+            sorted(items, key=lambda i: (i.datetime, i.id), reverse=True), **params
+        )
+
+
+@pytest.fixture
+def fake_stac_search_catalog(monkeypatch):
+    # do not reuse results of other tests
+    monkeypatch.setattr(mapchete_eo_settings, "stac_search_cache_size", 0)
+    items = []
+    for day in range(1, 11):
+        for x in range(0, 20, 3):
+            for y in range(0, 10, 4):
+                items.append(
+                    pystac.Item(
+                        id=f"item_{day}_{x}_{y}",
+                        geometry=box(x, y, x + 2, y + 2).__geo_interface__,
+                        bbox=[x, y, x + 2, y + 2],
+                        datetime=datetime.datetime(
+                            2023, 8, day, x, y, tzinfo=datetime.timezone.utc
+                        ),
+                        properties={},
+                    )
+                )
+    catalog = STACSearchCatalog(collections=["fake"], endpoint="https://fake")
+    catalog.client = _FakeClient(items)
+    return catalog
+
+
 def test_pf_sr_items(pf_sr_stac_collection):
     catalog = STACStaticCatalog(pf_sr_stac_collection)
     assert len(list(catalog.search())) > 0
@@ -32,6 +105,99 @@ def test_pf_qa_eo_bands(pf_qa_stac_collection):
     assert len(catalog.eo_bands) > 0
 
 
+def test_static_catalog_repeated_search(s2_stac_collection):
+    catalog = STACStaticCatalog(s2_stac_collection)
+    kwargs = dict(
+        time=TimeRange(start="2023-08-10", end="2023-08-11"),
+        area=box(15.71762, 46.22546, 15.78400, 46.27169),
+    )
+    items = [item.id for item in catalog.search(**kwargs)]
+    assert items
+    # second search uses the already built item index
+    assert [item.id for item in catalog.search(**kwargs)] == items
+    assert len(list(catalog.search())) > len(items)
+
+
+def test_stac_search_catalog_lazy_client(tmp_mpath):
+    # initializing does not request the endpoint
+    catalog = STACSearchCatalog(
+        collections=["sentinel-2-l2a"], endpoint=tmp_mpath / "catalog.json"
+    )
+    with pytest.raises(FileNotFoundError):
+        catalog.eo_bands
+
+
+def test_stac_search_split_time_range(fake_stac_search_catalog):
+    time_range = TimeRange(start="2023-08-01", end="2023-08-10")
+    bounds = Bounds(0, 0, 20, 10)
+    searches = fake_stac_search_catalog._split_searches(
+        time_range=time_range,
+        bounds=bounds,
+        config=StacSearchConfig(catalog_chunk_threshold=60),
+    )
+    assert len(searches) > 1
+    # split time ranges cover the whole time range without gaps or overlaps
+    days = []
+    for search in searches:
+        assert search.matched() <= 60
+        start, end = search.params["datetime"].split("/")
+        days.extend(day_range(to_datetime(start), to_datetime(end)))
+    assert days == day_range(to_datetime("2023-08-01"), to_datetime("2023-08-10"))
+
+
+def test_stac_search_split_spatially(fake_stac_search_catalog):
+    searches = fake_stac_search_catalog._split_searches(
+        time_range=TimeRange(start="2023-08-01", end="2023-08-01"),
+        bounds=Bounds(0, 0, 20, 10),
+        config=StacSearchConfig(catalog_chunk_threshold=5),
+    )
+    assert len(searches) > 1
+    # search chunks overlap with items, so some items are found more than once
+    items = [item.id for search in searches for item in search.items()]
+    assert len(items) > len(set(items))
+    assert len(set(items)) == 21
+
+
+@pytest.mark.parametrize("catalog_chunk_threshold", [5, 60])
+def test_stac_search_split_like_single_search(
+    fake_stac_search_catalog, catalog_chunk_threshold
+):
+    kwargs = dict(
+        time=TimeRange(start="2023-08-01", end="2023-08-10"),
+        bounds=Bounds(0, 0, 20, 10),
+    )
+    items = [item.id for item in fake_stac_search_catalog.search(**kwargs)]
+    assert len(items) == 210
+    split_items = [
+        item.id
+        for item in fake_stac_search_catalog.search(
+            search_kwargs=dict(catalog_chunk_threshold=catalog_chunk_threshold),
+            **kwargs,
+        )
+    ]
+    assert split_items == items
+
+
+def test_stac_search_cached(fake_stac_search_catalog, monkeypatch):
+    monkeypatch.setattr(mapchete_eo_settings, "stac_search_cache_size", 2)
+    monkeypatch.setattr(stac_search, "_search_results", dict())
+    kwargs = dict(
+        time=TimeRange(start="2023-08-01", end="2023-08-10"),
+        bounds=Bounds(0, 0, 20, 10),
+    )
+    items = list(fake_stac_search_catalog.search(**kwargs))
+    searches = len(fake_stac_search_catalog.client.searches)
+    assert searches
+
+    cached_items = list(fake_stac_search_catalog.search(**kwargs))
+    # the API was not requested again
+    assert len(fake_stac_search_catalog.client.searches) == searches
+    assert [item.id for item in cached_items] == [item.id for item in items]
+    # cached searches return new item instances
+    for item, cached_item in zip(items, cached_items):
+        assert item is not cached_item
+
+
 def test_write_static_catalog(static_catalog_small, tmp_path):
     output_path = static_catalog_small.write_static_catalog(
         output_path=str(tmp_path),
@@ -189,6 +355,24 @@ def test_earthsearch_catalog_chunked_search():
     assert len(all_products) == len(chunked_products)
 
 
+def test_earthsearch_catalog_cached_search(monkeypatch):
+    monkeypatch.setattr(mapchete_eo_settings, "stac_search_cache_size", 2)
+    search_kwargs = dict(
+        time=TimeRange(start="2022-04-01", end="2022-04-03"),
+        bounds=[16.3916015625, 48.69140625, 16.41357421875, 48.71337890625],
+    )
+    products = list(
+        EarthSearchV1S2L2A(collections=["sentinel-2-l2a"]).search(**search_kwargs)
+    )
+    cached_products = list(
+        EarthSearchV1S2L2A(collections=["sentinel-2-l2a"]).search(**search_kwargs)
+    )
+    assert [item.id for item in products] == [item.id for item in cached_products]
+    # cached searches return new item instances
+    for item, cached_item in zip(products, cached_products):
+        assert item is not cached_item
+
+
 def test_awssearch_catalog_cloud_percent():
     all_products = list(
         AWSSearchCatalogS2L2A(
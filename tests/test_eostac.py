@@ -1,3 +1,4 @@
+import pytest
 import xarray as xr
 from mapchete.formats import available_input_formats
 
@@ -36,3 +37,41 @@ def test_preprocessing(stac_mapchete):
 
     tile_mp = stac_mapchete.process_mp()
     assert tile_mp.open("inp").products
+
+
+@pytest.fixture
+def input_data_filter_spy(stac_mapchete, monkeypatch):
+    """Input data and a list recording the bounds of every products filter call."""
+    mp = stac_mapchete.mp()
+    input_data = list(mp.config.inputs.values())[0]
+    filtered_bounds = []
+    products_filter = input_data.products.filter
+
+    def _filter(bounds):
+        filtered_bounds.append(bounds)
+        return products_filter(bounds)
+
+    monkeypatch.setattr(input_data.products, "filter", _filter)
+    return input_data, filtered_bounds
+
+
+def test_open_caches_tile_products(input_data_filter_spy, test_tile):
+    input_data, filtered_bounds = input_data_filter_spy
+    products = list(input_data.open(test_tile).products)
+    assert products
+    assert list(input_data.open(test_tile).products) == products
+    assert len(filtered_bounds) == 1
+
+    input_data.cleanup()
+    assert list(input_data.open(test_tile).products) == products
+    assert len(filtered_bounds) == 2
+
+
+def test_open_tile_products_cache_size(input_data_filter_spy, test_tile, monkeypatch):
+    input_data, filtered_bounds = input_data_filter_spy
+    monkeypatch.setattr(input_data, "tile_products_cache_size", 1)
+    other_tile = test_tile.get_neighbors()[0]
+    for tile in [test_tile, test_tile, other_tile, test_tile]:
+        input_data.open(tile)
+    # second tile evicted the first one from the cache
+    assert len(filtered_bounds) == 3
@@ -2,7 +2,9 @@ import pytest
 import rasterio
 from mapchete.io import copy
 from mapchete.path import MPath
+from rasterio.vrt import WarpedVRT
 
+from mapchete_eo.io import assets
 from mapchete_eo.io.assets import (
     asset_mpath,
     convert_asset,
@@ -14,6 +16,7 @@ from mapchete_eo.io.assets import (
 )
 from mapchete_eo.io.profiles import COGDeflateProfile, JP2LossyProfile
 from mapchete_eo.platforms.sentinel2.metadata_parser import S2Metadata
+from mapchete_eo.settings import mapchete_eo_settings
 
 
 def test_asset_mpath(s2_stac_item):
@@ -122,6 +125,26 @@ def test_convert_raster_resolution(s2_stac_item, tmp_mpath):
         assert src.transform[0] == resolution
 
 
+@pytest.mark.parametrize("num_threads", [None, 2])
+def test_convert_asset_num_threads(s2_stac_item, tmp_mpath, monkeypatch, num_threads):
+    warp_extras = []
+
+    class RecordingWarpedVRT(WarpedVRT):
+        def __enter__(self):
+            warp_extras.append(self.warp_extras)
+            return super().__enter__()
+
+    monkeypatch.setattr(assets, "WarpedVRT", RecordingWarpedVRT)
+    convert_asset(
+        s2_stac_item, "red", tmp_mpath, resolution=20.0, num_threads=num_threads
+    )
+    assert warp_extras
+    # conversions use the gdal_num_threads setting by default
+    assert warp_extras[0]["NUM_THREADS"] == (
+        num_threads or mapchete_eo_settings.gdal_num_threads
+    )
+
+
 def test_convert_raster_profile(s2_stac_item, tmp_mpath):
     asset = "red"
     profile = COGDeflateProfile()
@@ -0,0 +1,78 @@
+import datetime
+
+import pytest
+from dateutil.tz import tzutc
+
+from mapchete_eo.time import (
+    time_ranges_intersect,
+    time_ranges_intersect_bulk,
+    to_datetime,
+)
+
+
+@pytest.mark.parametrize(
+    "inp,expected",
+    [
+        ("2023-08-10", datetime.datetime(2023, 8, 10)),
+        ("2023-08-10T09:56:51", datetime.datetime(2023, 8, 10, 9, 56, 51)),
+        (
+            "2023-08-10T09:56:51.123Z",
+            datetime.datetime(2023, 8, 10, 9, 56, 51, 123000, tzinfo=tzutc()),
+        ),
+        (
+            "2023-08-10T09:56:51+00:00",
+            datetime.datetime(2023, 8, 10, 9, 56, 51, tzinfo=tzutc()),
+        ),
+        # not ISO 8601
+        ("10 Aug 2023", datetime.datetime(2023, 8, 10)),
+        (datetime.date(2023, 8, 10), datetime.datetime(2023, 8, 10)),
+    ],
+)
+def test_to_datetime(inp, expected):
+    assert to_datetime(inp) == expected
+
+
+@pytest.mark.parametrize(
+    "t1,t2,expected",
+    [
+        (("2023-08-01", "2023-08-10"), ("2023-08-05", "2023-08-20"), True),
+        (("2023-08-05", "2023-08-20"), ("2023-08-01", "2023-08-10"), True),
+        # one range contains the other
+        (("2023-08-01", "2023-08-31"), ("2023-08-05", "2023-08-10"), True),
+        (("2023-08-05", "2023-08-10"), ("2023-08-01", "2023-08-31"), True),
+        # end date covers the whole day
+        (
+            (datetime.date(2023, 8, 1), datetime.date(2023, 8, 10)),
+            ("2023-08-10T12:00:00Z", "2023-08-20"),
+            True,
+        ),
+        (("2023-08-01", "2023-08-10"), ("2023-08-11", "2023-08-20"), False),
+        # open ended ranges
+        (("2023-08-01", "2023-08-10"), ("2023-08-05", None), True),
+        (("2023-08-01", "2023-08-10"), (None, "2023-07-31"), False),
+    ],
+)
+def test_time_ranges_intersect(t1, t2, expected):
+    assert time_ranges_intersect(t1, t2) is expected
+
+
+def test_time_ranges_intersect_mixed_offsets():
+    # both describe the same instant and are therefore also equal as cache keys
+    t_offset = datetime.datetime(
+        2023, 8, 10, 2, tzinfo=datetime.timezone(datetime.timedelta(hours=2))
+    )
+    t_utc = datetime.datetime(2023, 8, 10, 0, tzinfo=datetime.timezone.utc)
+    other = ("2023-08-10T01:00:00Z", "2023-08-20")
+    for t in [t_offset, t_utc, t_offset]:
+        assert time_ranges_intersect(("2023-08-01", t), other) is False
+        assert time_ranges_intersect(
+            (t, "2023-08-20"), ("2023-08-01", "2023-08-10T00:30:00Z")
+        )
+
+
+def test_time_ranges_intersect_bulk():
+    starts = ["2023-08-01", "2023-08-05", "2023-08-11", None]
+    ends = ["2023-08-10", "2023-08-20", "2023-08-20", "2023-08-20"]
+    assert time_ranges_intersect_bulk(
+        starts, ends, "2023-08-02", "2023-08-10T12:00:00Z"
+    ).tolist() == [True, True, False, True]